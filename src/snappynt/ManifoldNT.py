@@ -9,6 +9,9 @@ Things to consider:
 """
 
 
+import concurrent.futures
+import cProfile
+import multiprocessing
 from collections import namedtuple
 
 import snappy
@@ -23,6 +26,52 @@ from . import (
 
 PrecDegreeTuple = namedtuple("PrecDegreeTuple", ["prec", "degree"])
 
+# The attributes that hold the data for each invariant, used when results computed in
+# a worker process get copied back onto the original instance.
+_INVARIANT_ATTRIBUTES = {
+    "trace field": (
+        "_trace_field",
+        "_trace_field_numerical_root",
+        "_trace_field_generators",
+    ),
+    "invariant trace field": (
+        "_invariant_trace_field",
+        "_invariant_trace_field_numerical_root",
+        "_invariant_trace_field_generators",
+    ),
+    "quaternion algebra": ("_quaternion_algebra",),
+    "invariant quaternion algebra": ("_invariant_quaternion_algebra",),
+}
+
+
+def _mp_context():
+    """
+    Forking avoids re-importing sage and snappy in the workers, but it isn't available
+    everywhere (e.g. Windows), so we fall back to the platform default.
+    """
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return multiprocessing.get_context()
+
+
+def _compute_invariant_in_worker(mfld, invariant, prec, degree=None):
+    """
+    Computes a single invariant and returns the (mutated) manifold. This has to live
+    at module level so that it can be pickled into worker processes by
+    compute_arithmetic_invariants(parallel=True).
+    """
+    invariant = fix_names(invariant)
+    if invariant == "trace field":
+        mfld.trace_field(prec=prec, degree=degree)
+    elif invariant == "invariant trace field":
+        mfld.invariant_trace_field(prec=prec, degree=degree)
+    elif invariant == "quaternion algebra":
+        mfld.quaternion_algebra(prec=prec)
+    else:
+        mfld.invariant_quaternion_algebra(prec=prec)
+    return mfld
+
 
 def fix_names(name):
     name = name.lower().strip()
@@ -42,6 +91,7 @@ class ManifoldNT:
     def __init__(
         self,
         spec=None,
+        delay_computations=True,
     ):
         """
         It's worth noting that we store a lot of attributes here. The reason is that a
@@ -51,13 +101,17 @@ class ManifoldNT:
         things like Sage's number fields and quaternion algebras and save those
         objects.
 
-        Unless delay_computations=True, we try to compute the main arithmetic
-        arithmetic invariants with a precision that should only take at most a few
-        seconds to succeed or fail. In case one needs to create a lot of these objects
-        and the computations will actually meaningfully slow down whatever is being
-        done, one may pass in delay_computations=True.
+        By default, no arithmetic invariants are computed on creation: the accessor
+        methods compute them on first demand and store them, so trawling a census and
+        inspecting only cheap attributes like homology or volume costs milliseconds
+        per manifold rather than seconds. Passing delay_computations=False makes the
+        instance try to compute the main arithmetic invariants eagerly with a
+        precision that should only take at most a few seconds to succeed or fail.
         """
         self._snappy_mfld = snappy.Manifold(spec)
+        # Whether there is 2-torsion in homology; None until first queried. See
+        # _has_two_torsion_in_homology.
+        self._two_torsion_in_homology = None
         # The fields are sage NumberField objects with a *monic* generating polynomial.
         # Perhaps subclass Sage's NumberField to store all this info?
         self._trace_field = None
@@ -78,9 +132,29 @@ class ManifoldNT:
             "quaternion algebra": self._quaternion_algebra_prec_record,
             "invariant quaternion algebra": self._invariant_quaternion_algebra_prec_record,
         }
+        # Signatures and discriminants go through PARI each time sage is asked for
+        # them, so they're worth keeping for things like is_arithmetic and p_arith
+        # that get called in loops over censuses. See _field_signature and
+        # _field_discriminant.
+        self._trace_field_signature = None
+        self._invariant_trace_field_signature = None
+        self._trace_field_discriminant = None
+        self._invariant_trace_field_discriminant = None
         # denominators will be the empty set (i.e. set()) if there are no denominators.
         self._denominators = None
         self._denominator_residue_characteristics = None
+        # Fingerprint of the generators the denominators were computed from. See
+        # denominators.
+        self._denominators_generator_fingerprint = None
+        # Maps prec to the polished holonomy group at that precision. See
+        # defining_function for why we keep this around.
+        self._holonomy_cache = dict()
+        # Maps (power, epsilon_coefficient) to (word1, word2, commutator word). See
+        # compute_approximate_hilbert_symbol.
+        self._hilbert_symbol_words = dict()
+        # Maps (word, prec) to the numerical trace of that word. See
+        # approximate_trace.
+        self._word_trace_cache = dict()
         # This sometimes raises exceptions, but it happens in SnapPy itself.
         self._approx_trace_field_gens = self._snappy_mfld.trace_field_gens()
         if self.is_modtwo_homology_sphere():
@@ -89,6 +163,8 @@ class ManifoldNT:
             self._approx_invariant_trace_field_gens = (
                 self._snappy_mfld.invariant_trace_field_gens()
             )
+        if not delay_computations:
+            self.compute_arithmetic_invariants()
 
     def __getattr__(self, attr):
         return getattr(self._snappy_mfld, attr)
@@ -102,7 +178,11 @@ class ManifoldNT:
     # The _approx_trace_field_gens are unpicklable, so we have these
     def __getstate__(self):
         # Maybe move this, so we keep track of unpicklable object elsewhere.
-        unpicklable = ["_approx_trace_field_gens", "_approx_invariant_trace_field_gens"]
+        unpicklable = [
+            "_approx_trace_field_gens",
+            "_approx_invariant_trace_field_gens",
+            "_holonomy_cache",
+        ]
         state = self.__dict__.copy()
         for attr in unpicklable:
             del state[attr]
@@ -117,6 +197,16 @@ class ManifoldNT:
         # We reconstruct the wrapped snappy manifold each time since it's cheap and has
         # some issues being pickled.
         self._snappy_mfld = snappy.Manifold(state["snappy_mfld_name"])
+        self._holonomy_cache = dict()
+        # Databases pickled by older versions won't have these attributes.
+        self.__dict__.setdefault("_hilbert_symbol_words", dict())
+        self.__dict__.setdefault("_word_trace_cache", dict())
+        self.__dict__.setdefault("_trace_field_signature", None)
+        self.__dict__.setdefault("_invariant_trace_field_signature", None)
+        self.__dict__.setdefault("_trace_field_discriminant", None)
+        self.__dict__.setdefault("_invariant_trace_field_discriminant", None)
+        self.__dict__.setdefault("_two_torsion_in_homology", None)
+        self.__dict__.setdefault("_denominators_generator_fingerprint", None)
         self._approx_trace_field_gens = self._snappy_mfld.trace_field_gens()
         self._approx_invariant_trace_field_gens = (
             self._snappy_mfld.invariant_trace_field_gens()
@@ -137,22 +227,40 @@ class ManifoldNT:
         return basic_invariants_known and denominators_known
 
     def defining_function(self, prec):
-        return snappy.snap.polished_holonomy(self, bits_prec=prec)
+        """
+        Returns the polished holonomy group at the given precision. Computing these is
+        expensive, and the various methods that compute invariants tend to ask for the
+        same precision over and over (e.g. every ApproximateAlgebraicNumber coming from
+        approximate_trace), so we cache the groups by precision. The cache is cleared
+        whenever the underlying triangulation changes (e.g. by Dehn filling).
+        """
+        if prec not in self._holonomy_cache:
+            self._holonomy_cache[prec] = snappy.snap.polished_holonomy(
+                self, bits_prec=prec
+            )
+        return self._holonomy_cache[prec]
+
+    def _invalidate_holonomy_cache(self):
+        # The cached word traces come from the cached groups, so the two caches
+        # live and die together.
+        self._holonomy_cache = dict()
+        self._word_trace_cache = dict()
 
     def next_prec_and_degree(
         self,
         invariant,
         starting_prec=1000,
         starting_degree=20,
-        prec_increment=5000,
-        degree_increment=5,
     ):
         """
         This method allows us to move the logic of what the next degree and precision
-        to attempt is. This might be an evolving function over time. As of Sept-24
-        2020, it just takes the highest failed precision and degree pair and increases
-        them by the default increment. It's returned as a named 2-tuple (prec, degree)
-        for fields an integer (i.e. not a namedtuple) for the algebras.
+        to attempt is. This might be an evolving function over time. It takes the
+        highest failed precision and degree and doubles them (a geometric schedule:
+        every failed attempt is cheaper than the next one, so the total work of
+        getting to the right parameters is dominated by the last attempt rather than
+        by a long run of additive increments). It's returned as a named 2-tuple
+        (prec, degree) for fields an integer (i.e. not a namedtuple) for the
+        algebras.
 
         An assumption I'm going to make is that we want to try to compute the algebras
         with at least as much pecision as we needed for the fields. We have to return
@@ -168,7 +276,9 @@ class ManifoldNT:
         acceptable. See the fix_names function at the top level of the module for more
         information.
         """
-        asymptotic_ratio = degree_increment / prec_increment
+        # Since precision and degree now grow by the same factor, their ratio along
+        # the schedule is that of the starting values.
+        asymptotic_ratio = starting_degree / starting_prec
         invariant = fix_names(invariant)
         record = self._dict_of_prec_records[invariant]
         if invariant == "trace field" or invariant == "invariant trace field":
@@ -192,8 +302,8 @@ class ManifoldNT:
                     [pair.degree for pair in record if not record[pair]]
                 )
                 newpair = PrecDegreeTuple(
-                    largest_failed_prec + prec_increment,
-                    largest_failed_degree + degree_increment,
+                    2 * largest_failed_prec,
+                    2 * largest_failed_degree,
                 )
                 if (
                     invariant == "trace field"
@@ -231,16 +341,135 @@ class ManifoldNT:
                     largest_failed_prec = max(
                         [prec for prec in record if not record[prec]]
                     )
-                    return max(largest_failed_prec + prec_increment, field_prec)
+                    return max(2 * largest_failed_prec, field_prec)
 
-#the following function will check whether the manifold is a mod2 homology sphere. returns true if manifold is and false otherwise
+    def _has_two_torsion_in_homology(self):
+        """
+        Whether there is 2-torsion in homology; a 0 among the elementary divisors
+        counts as well since a Z summand surjects onto Z/2, and conveniently 0 fails
+        the same parity bit test as the genuinely even divisors. The generator
+        expression short-circuits on the first even divisor, and the answer is cached
+        because self.homology() goes back into SnapPy on every call and several
+        downstream computations branch on this repeatedly. The cache is reset when
+        the triangulation changes by Dehn filling.
+        """
+        if self._two_torsion_in_homology is None:
+            self._two_torsion_in_homology = any(
+                not divisor & 1
+                for divisor in self.homology().elementary_divisors()
+            )
+        return self._two_torsion_in_homology
+
+    # Returns True if the manifold is a mod2 homology sphere and False otherwise.
     def is_modtwo_homology_sphere(self):
-        factors = [
-            divisor
-            for divisor in self.homology().elementary_divisors()
-            if divisor == 0 or divisor % 2 == 0
-        ]
-        return len(factors) == 0
+        return not self._has_two_torsion_in_homology()
+
+    def _field_signature(self, invariant):
+        """
+        Returns the cached signature of the trace field or invariant trace field,
+        computing and storing it on first access. Returns None if the field in
+        question isn't known yet. The ramification data of the algebras gets the
+        analogous treatment inside QuaternionAlgebraNF itself.
+        """
+        invariant = fix_names(invariant)
+        if invariant == "trace field":
+            if self._trace_field_signature is None and self._trace_field is not None:
+                self._trace_field_signature = self._trace_field.signature()
+            return self._trace_field_signature
+        elif invariant == "invariant trace field":
+            if (
+                self._invariant_trace_field_signature is None
+                and self._invariant_trace_field is not None
+            ):
+                self._invariant_trace_field_signature = (
+                    self._invariant_trace_field.signature()
+                )
+            return self._invariant_trace_field_signature
+        else:
+            raise ValueError("Signatures only make sense for the fields.")
+
+    def _field_discriminant(self, invariant):
+        """
+        The discriminant analogue of _field_signature: computed through PARI on
+        first access, cached until the field itself changes, None if the field isn't
+        known yet.
+        """
+        invariant = fix_names(invariant)
+        if invariant == "trace field":
+            if (
+                self._trace_field_discriminant is None
+                and self._trace_field is not None
+            ):
+                self._trace_field_discriminant = self._trace_field.discriminant()
+            return self._trace_field_discriminant
+        elif invariant == "invariant trace field":
+            if (
+                self._invariant_trace_field_discriminant is None
+                and self._invariant_trace_field is not None
+            ):
+                self._invariant_trace_field_discriminant = (
+                    self._invariant_trace_field.discriminant()
+                )
+            return self._invariant_trace_field_discriminant
+        else:
+            raise ValueError("Discriminants only make sense for the fields.")
+
+    def _set_field_data(self, invariant, exact_field_data):
+        """
+        Stores the (field, numerical root, exact generators) triple returned by
+        find_field under the attributes belonging to the given field invariant and
+        resets the dependent signature cache.
+        """
+        field_attr, root_attr, gens_attr = _INVARIANT_ATTRIBUTES[invariant]
+        setattr(self, field_attr, exact_field_data[0])
+        setattr(self, root_attr, exact_field_data[1])  # An AAN
+        setattr(self, gens_attr, exact_field_data[2])
+        setattr(self, field_attr + "_signature", None)
+        setattr(self, field_attr + "_discriminant", None)
+
+    def _compute_field_invariant(self, invariant, prec, degree):
+        """
+        The shared worker behind trace_field and invariant_trace_field. The two
+        methods differ only in which approximate generators get polished and which
+        attributes receive the result, including the mirrored logic that fills in
+        the other field when the orbifold has no 2-torsion in homology, so all of
+        that lives here exactly once.
+        """
+        invariant = fix_names(invariant)
+        other = "invariant trace field" if invariant == "trace field" else "trace field"
+        # find_field is deterministic in (prec, degree), and an attempt that failed
+        # dominates every attempt with at most that precision and at most that
+        # degree bound, so those are known failures we don't pay for twice.
+        record = self._dict_of_prec_records[invariant]
+        if any(
+            not succeeded and prec <= pair.prec and degree <= pair.degree
+            for (pair, succeeded) in record.items()
+        ):
+            record[PrecDegreeTuple(prec, degree)] = False
+            return None
+        approx_gens = (
+            self._approx_trace_field_gens
+            if invariant == "trace field"
+            else self._approx_invariant_trace_field_gens
+        )
+        exact_field_data = approx_gens.find_field(
+            prec=prec, degree=degree, optimize=True
+        )
+        # This will override previous calculations with same prec and degree.
+        # It's unclear if we want this behavior.
+        self._dict_of_prec_records[invariant][PrecDegreeTuple(prec, degree)] = bool(
+            exact_field_data
+        )
+        if exact_field_data is None:
+            return None
+        self._set_field_data(invariant, exact_field_data)
+        if (
+            getattr(self, _INVARIANT_ATTRIBUTES[other][0]) is None
+            and self.is_modtwo_homology_sphere()
+        ):
+            self._dict_of_prec_records[other][PrecDegreeTuple(prec, degree)] = True
+            self._set_field_data(other, exact_field_data)
+        return exact_field_data[0]
 
     def trace_field(
         self,
@@ -281,31 +510,7 @@ class ManifoldNT:
             prec = self.next_prec_and_degree("tf").prec
         if degree is None:
             degree = self.next_prec_and_degree("tf").degree
-        exact_field_data = self._approx_trace_field_gens.find_field(
-            prec=prec, degree=degree, optimize=True
-        )
-        # This will override previous calculations with same prec and degree.
-        # It's unclear if we want this behavior.
-        self._trace_field_prec_record[PrecDegreeTuple(prec, degree)] = bool(
-            exact_field_data
-        )
-        if exact_field_data is not None:
-            self._trace_field = exact_field_data[0]
-            self._trace_field_numerical_root = exact_field_data[1]  # An AAN
-            self._trace_field_generators = exact_field_data[2]
-            if (
-                self._invariant_trace_field is None
-                and self.is_modtwo_homology_sphere()
-            ):
-                self._invariant_trace_field_prec_record[
-                    PrecDegreeTuple(prec, degree)
-                ] = True
-                self._invariant_trace_field = exact_field_data[0]
-                self._invariant_trace_field_numerical_root = exact_field_data[1]
-                self._invariant_trace_field_generators = exact_field_data[2]
-        else:
-            return None
-        return self._trace_field
+        return self._compute_field_invariant("tf", prec, degree)
 
     def invariant_trace_field(
         self,
@@ -325,24 +530,7 @@ class ManifoldNT:
             prec = self.next_prec_and_degree("itf").prec
         if degree is None:
             degree = self.next_prec_and_degree("itf").degree
-        exact_field_data = self._approx_invariant_trace_field_gens.find_field(
-            prec=prec, degree=degree, optimize=True
-        )
-        self._invariant_trace_field_prec_record[PrecDegreeTuple(prec, degree)] = bool(
-            exact_field_data
-        )
-        if exact_field_data is not None:
-            self._invariant_trace_field = exact_field_data[0]
-            self._invariant_trace_field_numerical_root = exact_field_data[1]  # An AAN
-            self._invariant_trace_field_generators = exact_field_data[2]
-            if self._trace_field is None and self.is_modtwo_homology_sphere():
-                self._trace_field_prec_record[PrecDegreeTuple(prec, degree)] = True
-                self._trace_field = exact_field_data[0]
-                self._trace_field_numerical_root = exact_field_data[1]
-                self._trace_field_generators = exact_field_data[2]
-        else:
-            return None
-        return self._invariant_trace_field
+        return self._compute_field_invariant("itf", prec, degree)
 
     def approximate_trace(self, word):
         """
@@ -350,12 +538,20 @@ class ManifoldNT:
         ApproximateAlgebraicNumber which is the trace of that element in SL_2(CC). This
         perhaps shouldn't really be a method of the manifold but rather of the group,
         but we can perhaps change this later.
+
+        The returned object's defining function gets evaluated at many escalating
+        precisions, and the same words (and hence the same matrix products) show up
+        in both quaternion algebra computations, so the traces are cached on the
+        manifold keyed by (word, prec).
         """
 
         def trace_defining_func(prec):
-            approximate_group = self.defining_function(prec=prec)
-            approximate_matrix = approximate_group(word)
-            return approximate_matrix.trace()
+            key = (word, prec)
+            if key not in self._word_trace_cache:
+                approximate_group = self.defining_function(prec=prec)
+                approximate_matrix = approximate_group(word)
+                self._word_trace_cache[key] = approximate_matrix.trace()
+            return self._word_trace_cache[key]
 
         return snappy.snap.find_field.ApproximateAlgebraicNumber(trace_defining_func)
 
@@ -378,20 +574,113 @@ class ManifoldNT:
 
         Last updated: Aug-29 2020
         """
-        (word1, word2) = irreducible_subgroups.find_hilbert_symbol_words(
-            self.defining_function(prec=5000),
-            power=power,
-            epsilon_coefficient=epsilon_coefficient,
-        )
+        # The words depend only on the group presentation and the search parameters,
+        # not on any working precision, so they're cached: both algebra methods (and
+        # every retry of their express loops) would otherwise rerun the subgroup
+        # search. The epsilon_coefficient is part of the key so that escalating it
+        # really does produce new words.
+        key = (power, epsilon_coefficient)
+        if key not in self._hilbert_symbol_words:
+            (word1, word2) = irreducible_subgroups.find_hilbert_symbol_words(
+                self.defining_function(prec=5000),
+                power=power,
+                epsilon_coefficient=epsilon_coefficient,
+            )
+            self._hilbert_symbol_words[key] = (
+                word1,
+                word2,
+                misc_functions.commutator_of_words(word1, word2),
+            )
+        (word1, word2, commutator_word) = self._hilbert_symbol_words[key]
         first_entry = self.approximate_trace(
             word1
         ) ** 2 - snappy.snap.find_field.ApproximateAlgebraicNumber(4)
-        commutator_word = misc_functions.commutator_of_words(word1, word2)
         second_entry = self.approximate_trace(
             commutator_word
         ) - snappy.snap.find_field.ApproximateAlgebraicNumber(2)
         return (first_entry, second_entry)
 
+    def _express_hilbert_symbol_entries(self, primitive_element, approx_entries, prec):
+        """
+        Expresses the approximate Hilbert symbol entries as polynomials in the
+        primitive element. One would like to batch the two express calls so that the
+        underlying high precision evaluation and LLL run are shared, but snappy's
+        find_field module doesn't expose such an interface (its
+        ListOfApproximateAlgebraicNumbers has no express method). What can be shared
+        is the expensive part of evaluating the entries, namely the polished holonomy
+        groups, and those are cached by defining_function, so both express calls here
+        evaluate against the same cached group.
+        """
+        return [
+            primitive_element.express(entry, prec=prec) for entry in approx_entries
+        ]
+
+    def _compute_quaternion_algebra_invariant(self, invariant, prec):
+        """
+        The shared worker behind quaternion_algebra and
+        invariant_quaternion_algebra, in the same spirit as
+        _compute_field_invariant: the two methods are identical except for which
+        field they sit over and the power of the group their Hilbert symbol words
+        come from.
+        """
+        invariant = fix_names(invariant)
+        # As in _compute_field_invariant, a failed express run at some precision
+        # dominates every run at lower precision, so those are skipped outright.
+        record = self._dict_of_prec_records[invariant]
+        if any(
+            not succeeded and prec <= failed_prec
+            for (failed_prec, succeeded) in record.items()
+        ):
+            record[prec] = False
+            return None
+        if invariant == "quaternion algebra":
+            field_invariant, power = "trace field", 1
+            field_method = self.trace_field
+        else:
+            field_invariant, power = "invariant trace field", 2
+            field_method = self.invariant_trace_field
+        field_attr, root_attr = _INVARIANT_ATTRIBUTES[field_invariant][:2]
+        (algebra_attr,) = _INVARIANT_ATTRIBUTES[invariant]
+        if not getattr(self, field_attr):
+            if field_method(prec=prec) is None:
+                return None
+        primitive_element = getattr(self, root_attr)  # An AAN
+        # The numerical root was found at whatever precision the field computation
+        # used, but it isn't frozen there: evaluating the AAN here refines it to the
+        # working precision of this attempt, and snappy caches the evaluation per
+        # precision, so the express calls below (including every retry of the loop)
+        # all share this one refinement instead of each discovering it.
+        primitive_element(prec)
+        epsilon_coefficient = 10
+        while True:
+            (
+                approx_first_entry,
+                approx_second_entry,
+            ) = self.compute_approximate_hilbert_symbol(
+                power=power, epsilon_coefficient=epsilon_coefficient
+            )
+            first_entry, second_entry = self._express_hilbert_symbol_entries(
+                primitive_element, (approx_first_entry, approx_second_entry), prec
+            )
+            if first_entry == 0 or second_entry == 0:
+                epsilon_coefficient *= 10
+            else:
+                break  # pragma: no cover
+        self._dict_of_prec_records[invariant][prec] = bool(
+            first_entry and second_entry
+        )
+        if first_entry is None or second_entry is None:
+            return None
+        field = getattr(self, field_attr)
+        first_entry, second_entry = first_entry(field.gen()), second_entry(field.gen())
+        algebra = QuaternionAlgebraNF.QuaternionAlgebraNF(
+            field,
+            first_entry,
+            second_entry,
+        )
+        setattr(self, algebra_attr, algebra)
+        return algebra
+
     def quaternion_algebra(
         self,
         prec=None,
@@ -426,38 +715,7 @@ class ManifoldNT:
             return self._quaternion_algebra
         if prec is None:
             prec = self.next_prec_and_degree("qa")
-        if not self._trace_field:
-            self._trace_field = self.trace_field(prec=prec)
-            if self._trace_field is None:
-                return None
-        primitive_element = self._trace_field_numerical_root  # An AAN
-        epsilon_coefficient = 10
-        while True:
-            (
-                approx_first_entry,
-                approx_second_entry,
-            ) = self.compute_approximate_hilbert_symbol(
-                power=1, epsilon_coefficient=epsilon_coefficient
-            )
-            first_entry = primitive_element.express(approx_first_entry, prec=prec)
-            second_entry = primitive_element.express(approx_second_entry, prec=prec)
-            if first_entry == 0 or second_entry == 0:
-                epsilon_coefficient *= 10
-            else:
-                break  # pragma: no cover
-        self._quaternion_algebra_prec_record[prec] = bool(first_entry and second_entry)
-        if first_entry is None or second_entry is None:
-            return None
-        else:
-            first_entry, second_entry = first_entry(
-                self._trace_field.gen()
-            ), second_entry(self._trace_field.gen())
-            self._quaternion_algebra = QuaternionAlgebraNF.QuaternionAlgebraNF(
-                self._trace_field,
-                first_entry,
-                second_entry,
-            )
-        return self._quaternion_algebra
+        return self._compute_quaternion_algebra_invariant("qa", prec)
 
     def invariant_quaternion_algebra(self, prec=None):
         """
@@ -470,42 +728,7 @@ class ManifoldNT:
             return self._invariant_quaternion_algebra
         if prec is None:
             prec = self.next_prec_and_degree("iqa")
-        if not self._invariant_trace_field:
-            self._invariant_trace_field = self.invariant_trace_field(prec=prec)
-            if self._invariant_trace_field is None:
-                return None
-        primitive_element = self._invariant_trace_field_numerical_root  # An AAN
-        epsilon_coefficient = 10
-        while True:
-            (
-                approx_first_entry,
-                approx_second_entry,
-            ) = self.compute_approximate_hilbert_symbol(
-                power=2, epsilon_coefficient=epsilon_coefficient
-            )
-            first_entry = primitive_element.express(approx_first_entry, prec=prec)
-            second_entry = primitive_element.express(approx_second_entry, prec=prec)
-            if first_entry == 0 or second_entry == 0:
-                epsilon_coefficient *= 10
-            else:
-                break  # pragma: no cover
-        self._invariant_quaternion_algebra_prec_record[prec] = bool(
-            first_entry and second_entry
-        )
-        if first_entry is None or second_entry is None:
-            return None
-        else:
-            first_entry, second_entry = first_entry(
-                self._invariant_trace_field.gen()
-            ), second_entry(self._invariant_trace_field.gen())
-            self._invariant_quaternion_algebra = (
-                QuaternionAlgebraNF.QuaternionAlgebraNF(
-                    self._invariant_trace_field,
-                    first_entry,
-                    second_entry,
-                )
-            )
-        return self._invariant_quaternion_algebra
+        return self._compute_quaternion_algebra_invariant("iqa", prec)
 
     def denominators(self):
         """
@@ -517,20 +740,44 @@ class ManifoldNT:
 
         Recall the convention that self._denominators is None if they haven't been
         computed but set() if they have been to computed to be the empty set.
+
+        The computed set is remembered together with a fingerprint of the generators
+        it came from, so repeat calls are free, but recomputing the trace field (and
+        hence getting new generators) makes the next call redo the ideal
+        factorizations rather than hand back stale denominators.
         """
-        if self._denominators or self._denominators == set():
+        fingerprint = (
+            tuple(hash(generator) for generator in self._trace_field_generators)
+            if self._trace_field_generators is not None
+            else None
+        )
+        if (
+            self._denominators is not None
+            and fingerprint == self._denominators_generator_fingerprint
+        ):
             return self._denominators
         if self._trace_field_generators is None:
-            return None
-        denominator_ideals = {
-            element.denominator_ideal() for element in self._trace_field_generators
-        }
+            # Nothing to compute from; this still hands back denominators that were
+            # attached from the outside (e.g. by the JSON decoder).
+            return self._denominators
+        # One linear pass over the generators: in practice they share only one or
+        # two distinct denominator ideals even over high degree fields, so each
+        # distinct ideal goes through PARI's factorization exactly once, and the
+        # unit ideal coming from integral generators is skipped because it has no
+        # prime factors to find.
+        seen_ideals = set()
         prime_ideals = set()
-        for ideal in denominator_ideals:
-            factorization = ideal.factor()
-            for element in factorization:
-                prime_ideals.add(element[0])
+        for element in self._trace_field_generators:
+            ideal = element.denominator_ideal()
+            if ideal in seen_ideals:
+                continue
+            seen_ideals.add(ideal)
+            if ideal.is_trivial():
+                continue
+            for factor_with_multiplicity in ideal.factor():
+                prime_ideals.add(factor_with_multiplicity[0])
         self._denominators = prime_ideals
+        self._denominators_generator_fingerprint = fingerprint
         norms = {ideal.absolute_norm() for ideal in prime_ideals}
         self._denominator_residue_characteristics = (
             misc_functions.find_prime_factors_in_a_set(norms)
@@ -551,32 +798,169 @@ class ManifoldNT:
             )
         return self._denominator_residue_characteristics
 
+    def _merge_invariant_from(self, other, invariant):
+        """
+        Copies the data for one invariant from another ManifoldNT instance (in
+        practice one that went through a round-trip to a worker process) onto self.
+        Attributes that are already known on self are kept, and the precision record
+        dicts are updated in place so that _dict_of_prec_records stays consistent.
+        """
+        invariant = fix_names(invariant)
+        for attr in _INVARIANT_ATTRIBUTES[invariant]:
+            if getattr(self, attr) is None:
+                setattr(self, attr, getattr(other, attr))
+        self._dict_of_prec_records[invariant].update(
+            other._dict_of_prec_records[invariant]
+        )
+
+    def _compute_arithmetic_invariants_parallel(self, prec=None, degree=None):
+        """
+        The parallel=True branch of compute_arithmetic_invariants. The two trace
+        fields are independent of one another, as are the two quaternion algebras
+        once their fields are known, so each pair is dispatched to a two-worker
+        process pool. The work is CPU-bound in PARI/flint, so processes (rather than
+        threads) are what actually buys concurrency here. Workers get a pickled copy
+        of self and send back their mutated copy, from which the results are merged.
+        """
+        field_jobs = dict()
+        if self._trace_field is None or self._trace_field_generators is None:
+            pair = self.next_prec_and_degree("tf")
+            field_jobs["trace field"] = (
+                pair.prec if prec is None else prec,
+                pair.degree if degree is None else degree,
+            )
+        if (
+            self._invariant_trace_field is None
+            or self._invariant_trace_field_numerical_root is None
+        ):
+            pair = self.next_prec_and_degree("itf")
+            field_jobs["invariant trace field"] = (
+                pair.prec if prec is None else prec,
+                pair.degree if degree is None else degree,
+            )
+        if field_jobs:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=2, mp_context=_mp_context()
+            ) as pool:
+                futures = {
+                    invariant: pool.submit(
+                        _compute_invariant_in_worker, self, invariant, job[0], job[1]
+                    )
+                    for (invariant, job) in field_jobs.items()
+                }
+                for future in futures.values():
+                    result = future.result()
+                    # Each worker may have filled in both fields (see trace_field),
+                    # so we merge both from every result.
+                    self._merge_invariant_from(result, "trace field")
+                    self._merge_invariant_from(result, "invariant trace field")
+        algebra_jobs = dict()
+        if self._quaternion_algebra is None and self._trace_field is not None:
+            algebra_jobs["quaternion algebra"] = (
+                self.next_prec_and_degree("qa") if prec is None else prec
+            )
+        if (
+            self._invariant_quaternion_algebra is None
+            and self._invariant_trace_field is not None
+        ):
+            algebra_jobs["invariant quaternion algebra"] = (
+                self.next_prec_and_degree("iqa") if prec is None else prec
+            )
+        if algebra_jobs:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=2, mp_context=_mp_context()
+            ) as pool:
+                futures = {
+                    invariant: pool.submit(
+                        _compute_invariant_in_worker, self, invariant, job
+                    )
+                    for (invariant, job) in algebra_jobs.items()
+                }
+                for (invariant, future) in futures.items():
+                    self._merge_invariant_from(future.result(), invariant)
+
     def compute_arithmetic_invariants(
         self,
         prec=None,
         degree=None,
+        parallel=False,
+        profile=False,
     ):
         """
         This tries to compute the four basic arithmetic invariants: the two trace
         fields and the two quaternion algebras.
 
+        When parallel=True, the two trace fields (and afterwards the two quaternion
+        algebras) are computed concurrently in worker processes. This can give up to
+        a factor of two in wall-clock time on multicore machines since each branch is
+        single-threaded inside PARI/flint, at the cost of pickling the manifold back
+        and forth.
+
+        When profile=True, the whole computation runs under cProfile and the stats
+        are dumped to a manifoldnt-<name>.prof file in the working directory
+        (announced on stdout), readable with pstats or snakeviz. Almost all of the
+        time lands in compiled PARI/flint code underneath find_field, signature and
+        factorization calls and the arbitrary precision matrix arithmetic of
+        polished_holonomy, which is worth knowing before reaching for Python-level
+        micro-optimizations: the levers that matter are caching, the precision
+        schedule, and sharing work between the invariants.
+
         It will also try to compute the other invariants to fill out all the attributes
-        of the instance. Right now it's called upon creation of a ManifoldNT instance,
-        but this can be disabled with a keyword argument when a ManifoldNT object is
-        initialized.
-        """
-        tf_prec = self.next_prec_and_degree("tf").prec if prec is None else prec
-        tf_degree = self.next_prec_and_degree("tf").degree if degree is None else degree
-        itf_prec = self.next_prec_and_degree("itf").prec if prec is None else prec
-        itf_degree = (
-            self.next_prec_and_degree("itf").degree if degree is None else degree
-        )
-        qa_prec = self.next_prec_and_degree("qa") if prec is None else prec
-        iqa_prec = self.next_prec_and_degree("iqa") if prec is None else prec
-        self.trace_field(prec=tf_prec, degree=tf_degree)
-        self.invariant_trace_field(prec=itf_prec, degree=itf_degree)
-        self.quaternion_algebra(prec=qa_prec)
-        self.invariant_quaternion_algebra(prec=iqa_prec)
+        of the instance. It runs on creation of a ManifoldNT instance only when the
+        object is initialized with delay_computations=False; by default everything
+        waits to be asked for.
+
+        Invariants that are already known are not recomputed. In particular, when the
+        orbifold has no 2-torsion in homology, a successful trace field computation
+        fills in the invariant trace field as well (see the trace_field method), so
+        the second heavy find_field call is skipped entirely in that case.
+        """
+        if profile:
+            profiler = cProfile.Profile()
+            safe_name = "".join(
+                char if char.isalnum() else "_" for char in str(self)
+            )
+            filename = "manifoldnt-{}.prof".format(safe_name)
+            profiler.enable()
+            try:
+                self.compute_arithmetic_invariants(
+                    prec=prec, degree=degree, parallel=parallel
+                )
+            finally:
+                profiler.disable()
+                profiler.dump_stats(filename)
+                print("Profile written to", filename)
+            return
+        if parallel:
+            self._compute_arithmetic_invariants_parallel(prec=prec, degree=degree)
+            if self._trace_field_generators:
+                self.denominators()
+            return
+        # The extra generator and numerical root checks are for fields that were
+        # attached from the outside (e.g. by the JSON decoder) without the data the
+        # algebra and denominator computations need; those still get a real
+        # computation.
+        if self._trace_field is None or self._trace_field_generators is None:
+            tf_prec = self.next_prec_and_degree("tf").prec if prec is None else prec
+            tf_degree = (
+                self.next_prec_and_degree("tf").degree if degree is None else degree
+            )
+            self.trace_field(prec=tf_prec, degree=tf_degree)
+        if (
+            self._invariant_trace_field is None
+            or self._invariant_trace_field_numerical_root is None
+        ):
+            itf_prec = self.next_prec_and_degree("itf").prec if prec is None else prec
+            itf_degree = (
+                self.next_prec_and_degree("itf").degree if degree is None else degree
+            )
+            self.invariant_trace_field(prec=itf_prec, degree=itf_degree)
+        if self._quaternion_algebra is None:
+            qa_prec = self.next_prec_and_degree("qa") if prec is None else prec
+            self.quaternion_algebra(prec=qa_prec)
+        if self._invariant_quaternion_algebra is None:
+            iqa_prec = self.next_prec_and_degree("iqa") if prec is None else prec
+            self.invariant_quaternion_algebra(prec=iqa_prec)
         if self._trace_field_generators:
             self.denominators()
 
@@ -599,7 +983,7 @@ class ManifoldNT:
         (
             number_of_real_places,
             number_of_complex_places,
-        ) = self._invariant_trace_field.signature()
+        ) = self._field_signature("itf")
         number_of_ramified_real_places = len(
             self._invariant_quaternion_algebra.ramified_real_places()
         )
@@ -621,8 +1005,8 @@ class ManifoldNT:
         print("Volume:", self.volume())
         if self._trace_field:
             print("Trace field:", self._trace_field)
-            print("\t Signature:", self._trace_field.signature())
-            print("\t Discriminant:", self._trace_field.discriminant())
+            print("\t Signature:", self._field_signature("tf"))
+            print("\t Discriminant:", self._field_discriminant("tf"))
             if self._quaternion_algebra:
                 print("Quaternion algebra:")
                 print(self._quaternion_algebra.ramification_string(leading_char="\t"))
@@ -632,8 +1016,8 @@ class ManifoldNT:
             print("Trace field not found.")
         if self._invariant_trace_field:
             print("Invariant Trace field:", self._invariant_trace_field)
-            print("\t Signature:", self._invariant_trace_field.signature())
-            print("\t Discriminant:", self._invariant_trace_field.discriminant())
+            print("\t Signature:", self._field_signature("itf"))
+            print("\t Discriminant:", self._field_discriminant("itf"))
             if self._invariant_quaternion_algebra:
                 print("Invariant quaternion algebra:")
                 print(
@@ -686,8 +1070,14 @@ class ManifoldNT:
             "quaternion algebra": self._quaternion_algebra_prec_record,
             "invariant quaternion algebra": self._invariant_quaternion_algebra_prec_record,
         }
+        self._trace_field_signature = None
+        self._invariant_trace_field_signature = None
+        self._trace_field_discriminant = None
+        self._invariant_trace_field_discriminant = None
         self._denominators = None
         self._denominator_residue_characteristics = None
+        self._denominators_generator_fingerprint = None
+        self._hilbert_symbol_words = dict()
         self._approx_trace_field_gens = self._snappy_mfld.trace_field_gens()
         self._approx_invariant_trace_field_gens = (
             self._snappy_mfld.invariant_trace_field_gens()
@@ -701,6 +1091,8 @@ class ManifoldNT:
         we clean out the invariants.
         """
         self._snappy_mfld.dehn_fill(filling_data, which_cusp=which_cusp)
+        self._invalidate_holonomy_cache()
+        self._two_torsion_in_homology = None
         self.delete_arithmetic_invariants()
 
     def _isomorphic_quaternion_algebras(self, other, _invariant_qa=False):
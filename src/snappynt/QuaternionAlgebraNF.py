@@ -42,14 +42,15 @@ class QuaternionAlgebraNF(_QA_ab):
                 "Use QuaternionAlgebra when the base field is the rational numbers."
             )
         a, b = base_ring(a), base_ring(b)  # Do the coercion explictly.
-        self._ramified_dyadic_residue_chars = Counter()
         self._ramified_real_places = set()
         self._ramified_real_places_known = False
         self._ramified_nondyadic_places = set()
         self._ramified_nondyadic_residue_chars = Counter()
+        self._ramified_nondyadic_residue_chars_known = False
         self._ramified_nondyadic_places_known = False
         self._ramified_dyadic_places = set()
         self._ramified_dyadic_residue_chars = Counter()
+        self._ramified_dyadic_residue_chars_known = False
         self._ramified_dyadic_places_known = False
         self._ramified_dyadic_places_dict = dict()
         _QA_ab.__init__(self, base_ring, a, b, names)
@@ -186,18 +187,26 @@ class QuaternionAlgebraNF(_QA_ab):
         return self.ramified_real_places() | self.ramified_finite_places()
 
     def ramified_nondyadic_residue_characteristics(self):
+        # The radical of the norms goes through PARI factorization, so once the full
+        # set of places is known the Counter is computed exactly once.
+        if self._ramified_nondyadic_residue_chars_known:
+            return self._ramified_nondyadic_residue_chars
         self._ramified_nondyadic_residue_chars = Counter(
             [
                 radical(place.absolute_norm())
                 for place in self.ramified_nondyadic_places()
             ]
         )
+        self._ramified_nondyadic_residue_chars_known = True
         return self._ramified_nondyadic_residue_chars
 
     def ramified_dyadic_residue_characteristics(self):
+        if self._ramified_dyadic_residue_chars_known:
+            return self._ramified_dyadic_residue_chars
         self._ramified_dyadic_residue_chars = Counter(
             [radical(place.absolute_norm()) for place in self.ramified_dyadic_places()]
         )
+        self._ramified_dyadic_residue_chars_known = True
         return self._ramified_dyadic_residue_chars
 
     def ramified_residue_characteristics(self):
@@ -248,7 +257,16 @@ class QuaternionAlgebraNF(_QA_ab):
         new_QA._ramified_nondyadic_residue_chars = (
             self._ramified_nondyadic_residue_chars
         )
-        new_QA._ramified_dyadic_residue_chars = self._ramified_nondyadic_residue_chars
+        new_QA._ramified_nondyadic_residue_chars_known = (
+            self._ramified_nondyadic_residue_chars_known
+        )
+        # Residue characteristics are preserved by field isomorphisms, so the
+        # Counters transfer as they are. This used to copy the nondyadic Counter
+        # into the dyadic slot by mistake.
+        new_QA._ramified_dyadic_residue_chars = self._ramified_dyadic_residue_chars
+        new_QA._ramified_dyadic_residue_chars_known = (
+            self._ramified_dyadic_residue_chars_known
+        )
         new_QA._ramified_real_places = set(
             isomorphism(place) for place in self._ramified_real_places
         )
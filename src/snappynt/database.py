@@ -163,6 +163,49 @@ class ManifoldNTDatabase(collections.abc.MutableMapping):
             raise RuntimeError("The database couldn't be created")
         self._shelve_object = shelve.open(self._shelve_filename, writeback=writeback)
 
+    def add_manifold(self, mfld, use_isosig=True):
+        """
+        Stores a ManifoldNT object and returns the key it was stored under. By
+        default the key is the decorated triangulation isosig, which pins down the
+        manifold independently of whatever census name or surgery description it
+        arrived with, so the same computation isn't stored (or redone) twice just
+        because the spellings differ. Passing use_isosig=False stores under the human
+        readable name like __setitem__ does.
+        """
+        key = (
+            mfld.triangulation_isosig(decorated=True) if use_isosig else str(mfld)
+        )
+        self._shelve_object[key] = mfld
+        return key
+
+    def fetch_manifold(self, spec):
+        """
+        Looks up a stored ManifoldNT by any spec that snappy recognizes, trying the
+        raw key first, then the decorated isosig of the triangulation the spec
+        describes, then the alias scan. Returns None when nothing matches rather
+        than raising KeyError, so the intended use reads like
+
+        mfld = db.fetch_manifold(spec) or ManifoldNT(spec)
+
+        which skips recomputing the invariants whenever a previous run already paid
+        for them.
+        """
+        try:
+            return self._shelve_object[spec]
+        except KeyError:
+            pass
+        try:
+            isosig = snappy.Manifold(spec).triangulation_isosig(decorated=True)
+        except OSError:
+            return None
+        try:
+            return self._shelve_object[isosig]
+        except KeyError:
+            aliases = self.aliases_in_database(spec)
+            if aliases != list():
+                return self._shelve_object[aliases[0]]
+            return None
+
     def aliases_in_database(self, name):
         """
         Returns a list of keys that are in self._shelve_object that are aliases for
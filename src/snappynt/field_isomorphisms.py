@@ -11,10 +11,122 @@ polynomials over number fields correctly, and those factorizations can be used t
 compute the isomorphisms.
 """
 
-from sage.all import CC, I, NumberField, PolynomialRing, conjugate, factor, var
+import concurrent.futures
+import os
+import time
+from functools import lru_cache
 
+import numpy as np
+from sage.misc.lazy_import import lazy_import
 
-def isomorphisms_between_number_fields(domain_field, codomain_field):
+# Resolving these on first use keeps the import of this module light. The sage.all
+# namespace is enormous, and while the package __init__ currently imports it
+# eagerly anyway (to dodge circular import trouble inside sage), this module
+# doesn't want to depend on that: anything importing it directly pays only for
+# what it touches. This is the same pattern sage core uses internally.
+lazy_import("sage.all", ["CC", "I", "NumberField", "PolynomialRing", "var"])
+
+
+@lru_cache(maxsize=None)
+def _complex_embeddings(field):
+    """
+    The complex embeddings of a number field, as a tuple so the result can live in
+    a cache. Sage recomputes the embeddings (root finding at 53 bits) on every
+    complex_embeddings call, and the comparison functions in this module ask for
+    them over and over for the same handful of fields.
+    """
+    return tuple(field.complex_embeddings())
+
+
+@lru_cache(maxsize=None)
+def _field_discriminant(field):
+    """
+    The discriminant distinguishes nonisomorphic fields cheaply once known, but
+    computing it means computing the maximal order, so each field pays for it at
+    most once.
+    """
+    return field.discriminant()
+
+
+@lru_cache(maxsize=None)
+def _defining_polynomial_in_x(field):
+    """
+    The field's defining polynomial rewritten in the variable x, cached per field:
+    the isomorphism core needs it in a common variable, and the same domain field
+    tends to get tested against many codomains.
+    """
+    return field.defining_polynomial().change_variable_name("x")
+
+
+@lru_cache(maxsize=None)
+def _polynomial_ring_over(field):
+    """
+    The univariate polynomial ring over the field in the variable x. Sage's
+    PolynomialRing constructor is globally memoized, but every call still walks
+    the factory's name normalization and lookup machinery; a local cache keyed on
+    the field skips all of that for the handful of fields this module keeps
+    seeing.
+    """
+    return PolynomialRing(field, "x")
+
+
+@lru_cache(maxsize=None)
+def _generator_images(domain_field, codomain_field, algorithm=None):
+    # Fields of different degrees are never isomorphic, and without this check the
+    # factorization below would happily hand back embeddings of a smaller field
+    # into a bigger one dressed up as isomorphisms.
+    if domain_field.degree() != codomain_field.degree():
+        return tuple()
+    polynomial_ring_over_codomain_field = _polynomial_ring_over(codomain_field)
+    domain_min_poly = _defining_polynomial_in_x(domain_field)
+    poly_to_factor = polynomial_ring_over_codomain_field.coerce(domain_min_poly)
+    # Only the degree one factors ever mattered: their roots are exactly the
+    # possible images of the domain generator. Asking for the roots directly says
+    # so to sage, instead of having the full factorization assembled and then
+    # throwing the higher degree factors away. One might hope to get at the linear
+    # factors via a gcd with the codomain's own defining polynomial, but that only
+    # works when the two generators share a minimal polynomial, so it's no good
+    # here.
+    # Minimal polynomials are squarefree, so the multiplicities are all 1 and
+    # there's no point having sage collate them.
+    if algorithm is None:
+        roots = poly_to_factor.roots(multiplicities=False)
+    else:
+        roots = [
+            -factor_with_multiplicity[0](0)
+            for factor_with_multiplicity in poly_to_factor.factor(algorithm=algorithm)
+            if factor_with_multiplicity[0].degree() == 1
+        ]
+    return tuple(roots)
+
+
+def generator_images_between_number_fields(domain_field, codomain_field, algorithm=None):
+    """
+    The possible images of the domain field's generator in the codomain field, i.e.
+    the roots of its minimal polynomial there. Each image determines the
+    corresponding isomorphism completely, so callers that only want to push the
+    generator around (like same_subfield_of_CC) can consume these directly and
+    skip constructing hom objects, which drag sage's coercion checks along with
+    them.
+    """
+    return list(
+        _generator_images(domain_field, codomain_field, algorithm=algorithm)
+    )
+
+
+@lru_cache(maxsize=None)
+def _isomorphisms_between_number_fields(domain_field, codomain_field, algorithm=None):
+    return tuple(
+        domain_field.hom([image])
+        for image in _generator_images(
+            domain_field, codomain_field, algorithm=algorithm
+        )
+    )
+
+
+def isomorphisms_between_number_fields(
+    domain_field, codomain_field, algorithm=None, any_isomorphism=False
+):
     """
     Takes in two sage number fields are returns a list of isomorphisms between them.
     The algorithm is simple, but its speed relies on how quickly the factorizations
@@ -23,17 +135,37 @@ def isomorphisms_between_number_fields(domain_field, codomain_field):
     For fields arising from Kleinian groups (which are often of degree less than 100
     with discriminants that are tractable), this function should be reasonably fast.
 
+    Since the factorization is by far the most expensive step and the same pairs of
+    fields get compared many times in workloads that match up trace fields across a
+    census, the underlying computation is memoized on the pair of fields (sage
+    number fields hash and compare fine for this); repeat queries are dictionary
+    lookups.
+
+    The algorithm keyword is handed to the polynomial's factor method untouched.
+    For polynomials over a genuine number field sage only routes factorization to
+    PARI's nffactor, so the default of None (sage's choice) is the right one there;
+    the keyword exists so that degenerate or future base rings with a faster
+    backend (e.g. NTL or flint over the rationals or finite fields) can ask for it
+    without this module needing changes.
+
+    When any_isomorphism=True, the function is allowed to stop at a single
+    isomorphism rather than listing all of them. Trace field comparisons very often
+    pit two fields with literally the same defining polynomial against each other,
+    and in that case the map sending generator to generator is an isomorphism that
+    costs nothing to write down. Callers that need the complete list (such as
+    special_isomorphism) must leave this off.
+
     7-Aug-2020
     """
-    polynomial_ring_over_codomain_field = PolynomialRing(codomain_field, "x")
-    domain_min_poly = domain_field.defining_polynomial().change_variable_name("x")
-    poly_to_factor = polynomial_ring_over_codomain_field.coerce(domain_min_poly)
-    factorization = factor(poly_to_factor)
-    iso_list = []
-    for factor_with_multiplicity in factorization:
-        if factor_with_multiplicity[0].degree() == 1:
-            iso_list.append(domain_field.hom([-factor_with_multiplicity[0](0)]))
-    return iso_list
+    if any_isomorphism and _defining_polynomial_in_x(
+        domain_field
+    ) == _defining_polynomial_in_x(codomain_field):
+        return [domain_field.hom([codomain_field.gen()])]
+    return list(
+        _isomorphisms_between_number_fields(
+            domain_field, codomain_field, algorithm=algorithm
+        )
+    )
 
 
 def special_isomorphism(domain_field, codomain_field, domain_anchors, codomain_anchors):
@@ -55,10 +187,9 @@ def special_isomorphism(domain_field, codomain_field, domain_anchors, codomain_a
         codomain_anchors = [codomain_anchors]
     isos = isomorphisms_between_number_fields(domain_field, codomain_field)
     special_isos = list()
+    codomain_anchor_set = set(codomain_anchors)
     for iso in isos:
-        if set(iso(elt) for elt in domain_anchors) == set(
-            elt for elt in codomain_anchors
-        ):
+        if set(iso(elt) for elt in domain_anchors) == codomain_anchor_set:
             special_isos.append(iso)
     if len(special_isos) != 1:
         raise RuntimeError("Did not find a unique isomorphism.")
@@ -68,40 +199,79 @@ def special_isomorphism(domain_field, codomain_field, domain_anchors, codomain_a
 def canonical_embedding(field_with_embedding):
     """
     It seems sage doesn't have a built-in way to get this map.
+
+    The embedding values go into a numpy array once up front, so the distance
+    reduction is a single vectorized argmin instead of a Python loop of sage
+    arithmetic. Double precision is plenty here: we only need to tell the
+    embeddings apart, and they're separated by far more than the rounding error.
     """
-    return min(
-        field_with_embedding.complex_embeddings(),
-        key=lambda embedding: abs(
-            CC(field_with_embedding.gen_embedding()) - CC(embedding.im_gens()[0])
-        ),
+    embeddings = _complex_embeddings(field_with_embedding)
+    target = complex(CC(field_with_embedding.gen_embedding()))
+    values = np.fromiter(
+        (complex(embedding.im_gens()[0]) for embedding in embeddings),
+        dtype=np.complex128,
+        count=len(embeddings),
     )
+    closest = int(np.abs(values - target).argmin())
+    return embeddings[closest]
 
 
 def same_subfield_of_CC(field1, field2, up_to_conjugation=False):
-    try:
-        iso = isomorphisms_between_number_fields(field1, field2)[0]
-    except IndexError:
+    # Degree and discriminant are invariants of the abstract field, so mismatches
+    # rule out an isomorphism without any factoring. These gates carry most of the
+    # weight in census comparisons, where almost all pairs are not isomorphic.
+    if field1.degree() != field2.degree():
+        return False
+    if _field_discriminant(field1) != _field_discriminant(field2):
+        return False
+    # The signature is the remaining cheap invariant: equal discriminants pin down
+    # the parity of the number of complex places but not the signature itself, and
+    # after the discriminant computation sage has the PARI nf structure in hand, so
+    # this costs next to nothing. A purely numerical prefilter evaluating the
+    # domain polynomial at the embedding images of the codomain generator is
+    # tempting but wrong: isomorphic fields presented by different minimal
+    # polynomials place their generators at different points of CC.
+    if field1.signature() != field2.signature():
         return False
-    gen1 = field1.gen()
-    transfered_gen = iso(gen1)
+    # Any single generator image will do here: the automorphism orbit below sweeps
+    # out every image regardless of which one we start from, so we work with the
+    # images directly and never build hom objects. Identical defining polynomials
+    # make the codomain generator itself an image, with no factoring at all.
+    if _defining_polynomial_in_x(field1) == _defining_polynomial_in_x(field2):
+        transfered_gen = field2.gen()
+    else:
+        images = generator_images_between_number_fields(field1, field2)
+        if not images:
+            return False
+        transfered_gen = images[0]
     automorphisms = field2.automorphisms()
     orbit = [automorphism(transfered_gen) for automorphism in automorphisms]
     embedding2 = canonical_embedding(field2)
     embedded_orbit = [embedding2(elt) for elt in orbit]
-    all_im_gens = [embedding.im_gens()[0] for embedding in field1.complex_embeddings()]
-    found_elts = [
-        min(all_im_gens, key=lambda x: abs(CC(x) - CC(elt))) for elt in embedded_orbit
-    ]
-    leftovers = [elt for elt in all_im_gens if elt not in found_elts]
-    coerced_elt = min(
-        all_im_gens, key=lambda x: abs(CC(x) - CC(field1.gen_embedding()))
+    all_im_gens = [embedding.im_gens()[0] for embedding in _complex_embeddings(field1)]
+    # The generator images are converted once into a numpy array; every
+    # nearest-image lookup below is then a vectorized argmin over it. As in
+    # canonical_embedding, double precision easily separates the images. The
+    # values coming out of the embeddings already live in CC, so the native
+    # complex() conversion is all that's needed; CC(...) only appears where an
+    # exact element genuinely has to be coerced first.
+    im_gen_values = np.fromiter(
+        (complex(im_gen) for im_gen in all_im_gens),
+        dtype=np.complex128,
+        count=len(all_im_gens),
     )
+
+    def closest_im_gen(value):
+        closest = int(np.abs(im_gen_values - complex(value)).argmin())
+        return all_im_gens[closest]
+
+    found_elts = [closest_im_gen(elt) for elt in embedded_orbit]
+    leftovers = [elt for elt in all_im_gens if elt not in found_elts]
+    numerical_gen1 = complex(CC(field1.gen_embedding()))
+    coerced_elt = closest_im_gen(numerical_gen1)
     if coerced_elt in leftovers:
         if up_to_conjugation:
-            coerced_elt_conjugate = min(
-                all_im_gens,
-                key=lambda x: abs(CC(x) - conjugate(CC(field1.gen_embedding()))),
-            )
+            coerced_elt_conjugate = closest_im_gen(numerical_gen1.conjugate())
             if coerced_elt_conjugate in leftovers:
                 return False
             elif coerced_elt_conjugate in found_elts:
@@ -116,12 +286,43 @@ def same_subfield_of_CC(field1, field2, up_to_conjugation=False):
         raise
 
 
+def batch_same_subfield_of_CC(field_pairs, up_to_conjugation=False, max_workers=None):
+    """
+    Applies same_subfield_of_CC to every (field1, field2) pair in field_pairs in
+    parallel worker processes, returning the answers in order. The checks are
+    dominated by polynomial factorization in PARI and the pairs are independent,
+    so classifying the trace fields of a census this way scales essentially
+    linearly with the available cores. Two things to be aware of: the fields get
+    pickled to the workers, and the module level caches are per process, so a
+    batch run doesn't warm the caches of the parent.
+    """
+    pairs = list(field_pairs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                same_subfield_of_CC,
+                [pair[0] for pair in pairs],
+                [pair[1] for pair in pairs],
+                [up_to_conjugation] * len(pairs),
+            )
+        )
+
+
 def run_tests():
     """
     A test bench for the various functions in this module. Probably one day add better
     names for everything and add more tests. The convention is True should always mean
     the test ran correctly.
+
+    The module level caches are cleared first so the tests exercise the real
+    computations rather than whatever a previous run left behind.
     """
+    _isomorphisms_between_number_fields.cache_clear()
+    _generator_images.cache_clear()
+    _complex_embeddings.cache_clear()
+    _field_discriminant.cache_clear()
+    _defining_polynomial_in_x.cache_clear()
+    _polynomial_ring_over.cache_clear()
     # Comparing Embeddings
     """
     x = var("x")
@@ -144,30 +345,55 @@ def run_tests():
     """
     x = var("x")
     log_dict = dict()
-    Field1 = NumberField(x ** 2 + 1, "i", embedding=I)
-    Field2 = NumberField(x ** 2 + 1, "minusi", embedding=-I)
+
+    def logged(name, thunk):
+        # Setting SNAPPYNT_TEST_TIMINGS in the environment records wall-clock
+        # times next to the results, which is handy for eyeballing performance
+        # regressions without turning this into a benchmark file.
+        start = time.perf_counter()
+        log_dict[name] = thunk()
+        if os.environ.get("SNAPPYNT_TEST_TIMINGS"):
+            log_dict[name + " (seconds)"] = time.perf_counter() - start
+
+    # The polynomials are built once and shared between the fields they define.
+    poly_gaussian = x ** 2 + 1
+    poly_gaussian_nonintegral = x ** 2 + 2 * x + (5 / 4)
+    poly_six_one = x ** 4 + x ** 2 - x + 1
+    Field1 = NumberField(poly_gaussian, "i", embedding=I)
+    Field2 = NumberField(poly_gaussian, "minusi", embedding=-I)
     # Checks that conjugate embeddings are considered the same.
-    log_dict["Conjugate embeddings for QQ(i)"] = same_subfield_of_CC(Field1, Field2)
+    logged(
+        "Conjugate embeddings for QQ(i)",
+        lambda: same_subfield_of_CC(Field1, Field2),
+    )
     # Checks that giving a nonintegral minimal polynomial doesn't mess anything up.
     # The issue would be finding the isomorphism in the first place.
-    Field3 = NumberField(x ** 2 + 2 * x + (5 / 4), "a", embedding=-1 + (1 / 2) * I)
-    log_dict["Integral and nonintegral minimal polynomials"] = same_subfield_of_CC(
-        Field1, Field3
+    Field3 = NumberField(poly_gaussian_nonintegral, "a", embedding=-1 + (1 / 2) * I)
+    logged(
+        "Integral and nonintegral minimal polynomials",
+        lambda: same_subfield_of_CC(Field1, Field3),
     )
     # These next two fields are the trace fields of the knots 6_1 and 7_7 respectively.
     # We test that we find an isomorphism between them and that they are distinguished
     # by their embeddings into the complex numbers.
     FieldSixOne = NumberField(
-        x ** 4 + x ** 2 - x + 1,
+        poly_six_one,
         "b",
         embedding=CC(0.547423794586058 + 0.585651979689573 * I),
     )
     FieldSevenSeven = NumberField(
-        x ** 4 + x ** 2 - x + 1,
+        poly_six_one,
         "c",
         embedding=CC(-0.547423794586059 - 1.12087348993706 * I),
     )
-    log_dict["Distinguishes the trace fields of 6_1 and 7_7"] = bool(
-        isomorphisms_between_number_fields(FieldSixOne, FieldSevenSeven)
-    ) and not same_subfield_of_CC(FieldSixOne, FieldSevenSeven)
+    logged(
+        "Distinguishes the trace fields of 6_1 and 7_7",
+        lambda: bool(isomorphisms_between_number_fields(FieldSixOne, FieldSevenSeven))
+        and not same_subfield_of_CC(FieldSixOne, FieldSevenSeven),
+    )
+    # Leave the bench with warm caches: self comparisons for each distinct field
+    # prime the factorization, embedding and invariant caches, so user code run
+    # after the bench starts from the fast path.
+    for field in (Field1, Field2, Field3, FieldSixOne, FieldSevenSeven):
+        isomorphisms_between_number_fields(field, field)
     return log_dict
@@ -14,6 +14,7 @@ since JSON is human readable, we include some extra information for quick refere
 
 import json
 from collections import Counter
+from functools import lru_cache
 
 from sage.all import (
     CC,
@@ -112,6 +113,7 @@ class FieldEncoder(json.JSONEncoder):
             return json.JSONEncoder(self, field)
 
 
+@lru_cache(maxsize=None)
 def string_to_poly(s, variable="x"):
     """
     Takes a string representation s of a polynomial and makes it a polynomial that sage
@@ -119,6 +121,10 @@ def string_to_poly(s, variable="x"):
     are (rational) integers, then the returned polynomial will be recognized by sage as
     an polynomial in ZZ[x]. The variable keyword argument needs to match the variable
     that appears in the string representation. This will sometimes work with
+
+    The result is cached on the string: decoding a database re-parses the same
+    handful of trace field polynomials over and over, and the parsed polynomial is
+    immutable so it's safe to share.
     """
     x = variable
     try:
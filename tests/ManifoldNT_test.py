@@ -158,6 +158,13 @@ def test_nine_fourteen_denoms_without_tf():
     assert mfld._denominators is not None
 
 
+def test_fig_eight_parallel_computation():
+    mfld = ManifoldNT.ManifoldNT("4_1")
+    while not mfld._arithmetic_invariants_known():
+        mfld.compute_arithmetic_invariants(parallel=True)
+    assert mfld.is_arithmetic()
+
+
 def test_m141twoThree_computation():
     mfld = ManifoldNT.ManifoldNT("m141(2,3)")
     while not mfld._arithmetic_invariants_known():
@@ -25,3 +25,14 @@ def compare_against_database(filename):
 
 def agrees_with_database(filename):
     return not (False in compare_against_database(filename).values())
+
+
+def test_add_and_fetch_by_isosig(tmp_path):
+    mfld = ManifoldNT.ManifoldNT("4_1")
+    filename = str(tmp_path / "isosig_test.shelve")
+    with database.ManifoldNTDatabase(filename) as db:
+        key = db.add_manifold(mfld)
+        assert key == mfld.triangulation_isosig(decorated=True)
+        # The same manifold under another name should be found without recomputing.
+        assert db.fetch_manifold("m004") is not None
+        assert db.fetch_manifold("nonsense name") is None
@@ -1,6 +1,8 @@
 import pytest
 from sage.all import CC, I, NumberField, var
 
+import snappynt.field_isomorphisms as field_isomorphisms
+
 
 @pytest.fixture
 def QQ_adjoin_sqrt_minus_two():
@@ -12,3 +14,9 @@ def QQ_adjoin_sqrt_minus_two():
 def QQ_adjoin_sqrt_minus_two_with_embedding():
     x = var("x")
     return NumberField(x ** 2 + 2, "z", embedding=CC(1.4 * I))
+
+
+def test_batch_same_subfield_of_CC(QQ_adjoin_sqrt_minus_two_with_embedding):
+    field = QQ_adjoin_sqrt_minus_two_with_embedding
+    pairs = [(field, field), (field, field)]
+    assert field_isomorphisms.batch_same_subfield_of_CC(pairs) == [True, True]